@@ -19,11 +19,15 @@
 # This file will use AIDA64 shared memory to get hardware sensors
 # For Windows platforms only
 
+import atexit
 import ctypes
 import math
-import xml.etree.ElementTree as ET
+import threading
+import time
+from collections import namedtuple
 from statistics import mean
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Optional, Sequence
+from html import unescape
 from ctypes import wintypes
 
 import psutil
@@ -51,184 +55,357 @@ CloseHandle = kernel32.CloseHandle
 CloseHandle.argtypes = [wintypes.HANDLE]
 CloseHandle.restype = wintypes.BOOL
 
+
+class MEMORY_BASIC_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("BaseAddress", wintypes.LPVOID),
+        ("AllocationBase", wintypes.LPVOID),
+        ("AllocationProtect", wintypes.DWORD),
+        ("RegionSize", ctypes.c_size_t),
+        ("State", wintypes.DWORD),
+        ("Protect", wintypes.DWORD),
+        ("Type", wintypes.DWORD),
+    ]
+
+
+VirtualQuery = kernel32.VirtualQuery
+VirtualQuery.argtypes = [wintypes.LPCVOID, ctypes.POINTER(MEMORY_BASIC_INFORMATION), ctypes.c_size_t]
+VirtualQuery.restype = ctypes.c_size_t
+
+# AIDA64共享内存中的传感器类型 (系统/温度/风扇/电压/功耗): 标签 -> (类型, 结束标签)
+SENSOR_TAGS = {tag: (tag.decode(), b"</" + tag + b">") for tag in (b'sys', b'temp', b'fan', b'volt', b'pwr')}
+# 每条传感器记录中的字段: (开始标签, 结束标签)
+ID_FIELD = (b"<id>", b"</id>")
+LABEL_FIELD = (b"<label>", b"</label>")
+VALUE_FIELD = (b"<value>", b"</value>")
+
+# 本模块使用的AIDA64传感器ID
+SENSOR_CPU_USAGE = 'SCPUUTI'  # %
+SENSOR_CPU_CLOCK = 'SCPUCLK'  # MHz
+SENSOR_CPU_TEMPS = ('TCPUPKG', 'TCPUIAC', 'TCPU')  # °C, CPU Package / CPU IA Cores / CPU，按优先级排列
+SENSOR_CPU_FAN = 'FCPU'  # RPM
+SENSOR_CPU_VOLTAGE = 'VCPU'  # V
+SENSOR_CPU_POWER = 'PCPUPKG'  # W
+SENSOR_GPU_TEMP = 'TGPU1'  # °C
+SENSOR_GPU_USED_MEM = 'SUSEDVMEM'  # MB
+SENSOR_GPU_FREE_MEM = 'SFREEVMEM'  # MB
+SENSOR_GPU_FAN = 'FGPU1'  # RPM
+SENSOR_GPU_VOLTAGE = 'VGPU1'  # V
+SENSOR_GPU_POWER = 'PGPU1'  # W
+SENSOR_SWAP_USAGE = 'SVIRTMEMUTI'  # %
+SENSOR_MEMORY_USAGE = 'SMEMUTI'  # %
+SENSOR_MEMORY_USED = 'SUSEDMEM'  # MB
+SENSOR_MEMORY_FREE = 'SFREEMEM'  # MB
+
+# 解析时只保留以上传感器 (以及CPU核心时钟)，其余传感器直接跳过
+WANTED_SENSOR_IDS = frozenset({
+    SENSOR_CPU_USAGE, SENSOR_CPU_CLOCK, *SENSOR_CPU_TEMPS, SENSOR_CPU_FAN, SENSOR_CPU_VOLTAGE, SENSOR_CPU_POWER,
+    SENSOR_GPU_TEMP, SENSOR_GPU_USED_MEM, SENSOR_GPU_FREE_MEM, SENSOR_GPU_FAN, SENSOR_GPU_VOLTAGE, SENSOR_GPU_POWER,
+    SENSOR_SWAP_USAGE, SENSOR_MEMORY_USAGE, SENSOR_MEMORY_USED, SENSOR_MEMORY_FREE,
+})
+# CPU核心时钟传感器ID前缀 (SCC-x-y)，数量取决于CPU核心数，按前缀保留
+CPU_CLOCK_PREFIX = 'SCC-'
+
+# 单个传感器的数据 (类型, 名称, 数值, 换算为字节的数值 (仅内存传感器))
+SensorRecord = namedtuple('SensorRecord', ['type', 'label', 'value', 'value_bytes'], defaults=(None,))
+
 # Global cache for sensor data
 _sensor_cache = {}
 _cache_valid = False
+_cache_ts = 0.0
+# 缓存有效期 (秒)，一次刷新内的多次传感器查询共享同一份数据
+_CACHE_TTL = 0.5
 
-def read_aida64_shared_memory() -> Dict[str, Any]:
-    """读取AIDA64共享内存数据"""
-    global _sensor_cache, _cache_valid
+# 本机的CPU核心时钟传感器ID列表 (SCC-*)，每次成功解析时更新
+_cpu_clock_ids = []
+# 当前可用的CPU温度传感器ID (按SENSOR_CPU_TEMPS的优先级)，每次成功解析时更新
+_cpu_temp_id = None
+
+# 以MB为单位的内存传感器，解析时换算为字节并存入SensorRecord.value_bytes
+MEMORY_MB_SENSORS = (SENSOR_MEMORY_USED, SENSOR_MEMORY_FREE)
+
+# psutil查询结果缓存: (函数, 参数) -> (时间戳, 结果)
+_psutil_cache = {}
+
+# 共享内存名称
+AIDA64_MAPPING_NAME = "AIDA64_SensorValues"
+
+# 共享内存句柄和映射视图在多次读取之间保持打开，AIDA64会原地更新其内容
+_h_map = None
+_p_buf = None
+_buf_size = 0
+_map_opened_ts = 0.0
+# 持有句柄会让AIDA64退出后共享内存依然存在 (数据停止更新)，因此定期关闭并重新打开，
+# 使AIDA64未运行时能够重新检测到 (打开失败)
+_MAP_REOPEN_INTERVAL = 5.0
+# 各统计项在不同线程中读取传感器 (见scheduler.py)，打开/拷贝/关闭共享内存必须持有此锁
+_shm_lock = threading.Lock()
+
+def get_view_size(p_buf) -> int:
+    """获取共享内存映射视图的大小 (字节)"""
+    mbi = MEMORY_BASIC_INFORMATION()
+    if not VirtualQuery(p_buf, ctypes.byref(mbi), ctypes.sizeof(mbi)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return mbi.RegionSize
+
+def open_aida64_shared_memory():
+    """打开AIDA64共享内存并映射到进程地址空间 (已打开且未到重新打开时间时不做任何操作)
+    
+    调用时必须持有_shm_lock
+    """
+    global _h_map, _p_buf, _buf_size, _map_opened_ts
+    
+    if _p_buf:
+        if (time.monotonic() - _map_opened_ts) < _MAP_REOPEN_INTERVAL:
+            return
+        close_aida64_shared_memory()
     
-    # 共享内存名称
-    mapping_name = "AIDA64_SensorValues"
+    # 打开共享内存 (FILE_MAP_READ = 0x0004)
+    h_map_file = OpenFileMapping(0x0004, False, AIDA64_MAPPING_NAME)
+    
+    # 检查是否为无效句柄
+    if h_map_file == ctypes.c_void_p(-1).value or h_map_file == 0:
+        err_code = ctypes.get_last_error()
+        if err_code == 5:
+            raise Exception("访问被拒绝。请尝试以管理员身份运行脚本，或检查AIDA64共享内存权限设置。")
+        elif err_code == 2:
+            raise Exception("未找到共享内存。请确保AIDA64已启动且硬件监控模块已启用共享内存功能。")
+        else:
+            raise ctypes.WinError(err_code)
     
     try:
-        # 打开共享内存 (FILE_MAP_READ = 0x0004)
-        h_map_file = OpenFileMapping(0x0004, False, mapping_name)
+        # 映射共享内存到进程地址空间
+        p_buf = MapViewOfFile(h_map_file, 0x0004, 0, 0, 0)
+        if not p_buf:
+            raise ctypes.WinError(ctypes.get_last_error())
         
-        # 检查是否为无效句柄
-        if h_map_file == ctypes.c_void_p(-1).value or h_map_file == 0:
-            err_code = ctypes.get_last_error()
-            if err_code == 5:
-                raise Exception("访问被拒绝。请尝试以管理员身份运行脚本，或检查AIDA64共享内存权限设置。")
-            elif err_code == 2:
-                raise Exception("未找到共享内存。请确保AIDA64已启动且硬件监控模块已启用共享内存功能。")
-            else:
-                raise ctypes.WinError(err_code)
+        try:
+            buf_size = get_view_size(p_buf)
+        except Exception:
+            UnmapViewOfFile(p_buf)
+            raise
+    except Exception:
+        CloseHandle(h_map_file)
+        raise
+    
+    _h_map, _p_buf, _buf_size = h_map_file, p_buf, buf_size
+    _map_opened_ts = time.monotonic()
+
+def close_aida64_shared_memory():
+    """取消映射并关闭AIDA64共享内存句柄 (调用时必须持有_shm_lock)"""
+    global _h_map, _p_buf, _buf_size
+    
+    if _p_buf:
+        UnmapViewOfFile(_p_buf)
+    if _h_map:
+        CloseHandle(_h_map)
+    _h_map, _p_buf, _buf_size = None, None, 0
+
+def close_aida64_shared_memory_at_exit():
+    """程序退出时关闭AIDA64共享内存"""
+    with _shm_lock:
+        close_aida64_shared_memory()
+
+atexit.register(close_aida64_shared_memory_at_exit)
+
+def get_field(buf: bytes, field: Tuple[bytes, bytes], start: int, end: int) -> Optional[str]:
+    """获取buf[start:end]范围内字段 (开始标签, 结束标签) 的文本，不存在时返回None"""
+    open_tag, close_tag = field
+    field_start = buf.find(open_tag, start, end)
+    if field_start < 0:
+        return None
+    field_start += len(open_tag)
+    field_end = buf.find(close_tag, field_start, end)
+    if field_end < 0:
+        return None
+    text = buf[field_start:field_end].decode("utf-8", errors="ignore")
+    return unescape(text) if "&" in text else text
+
+def parse_aida64(raw_bytes: bytes) -> Dict[str, SensorRecord]:
+    """解析AIDA64共享内存内容
+    
+    AIDA64的数据格式非常固定: 扁平的<sys><id>..</id><label>..</label><value>..</value></sys>记录，
+    没有命名空间、嵌套或属性，因此直接按字节扫描，无需通用XML解析器
+    """
+    sensors_data = {}
+    # 循环内使用的函数和常量绑定为局部变量，避免每条记录重复查找全局变量
+    find = raw_bytes.find
+    get_sensor_tag = SENSOR_TAGS.get
+    field = get_field
+    id_field, label_field, value_field = ID_FIELD, LABEL_FIELD, VALUE_FIELD
+    wanted_ids = WANTED_SENSOR_IDS
+    pos = 0
+    while True:
+        tag_start = find(b"<", pos)
+        if tag_start < 0:
+            break
+        tag_end = find(b">", tag_start)
+        if tag_end < 0:
+            break
+        pos = tag_end + 1
+        
+        sensor_tag = get_sensor_tag(raw_bytes[tag_start + 1:tag_end])
+        if sensor_tag is None:
+            continue
+        sensor_type, close_tag = sensor_tag
+        
+        record_end = find(close_tag, pos)
+        if record_end < 0:
+            break
+        
+        record_start = pos
+        pos = record_end + len(close_tag)
         
+        # 跳过本模块不使用的传感器，不再提取其名称和数值
+        sensor_id = field(raw_bytes, id_field, record_start, record_end)
+        if sensor_id not in wanted_ids and not (sensor_id and sensor_id.startswith(CPU_CLOCK_PREFIX)):
+            continue
+        
+        label = field(raw_bytes, label_field, record_start, record_end)
+        value = field(raw_bytes, value_field, record_start, record_end)
+        if label is not None and value is not None:
+            sensors_data[sensor_id] = SensorRecord(sensor_type, label, value)
+    
+    return sensors_data
+
+def convert_memory_bytes(sensors_data: Dict[str, SensorRecord]):
+    """将以MB为单位的内存传感器数值换算为字节，保存到对应记录的value_bytes中"""
+    for sensor_id in MEMORY_MB_SENSORS:
+        record = sensors_data.get(sensor_id)
+        if record is None:
+            continue
         try:
-            # 映射共享内存到进程地址空间
-            p_buf = MapViewOfFile(h_map_file, 0x0004, 0, 0, 0)
-            if not p_buf:
-                raise ctypes.WinError(ctypes.get_last_error())
+            sensors_data[sensor_id] = record._replace(value_bytes=int(float(record.value) * 1024 * 1024))
+        except ValueError:
+            continue
+
+def find_cpu_temp_id(sensors_data: Dict[str, SensorRecord]) -> Optional[str]:
+    """按优先级 (CPU Package、CPU IA Cores、普通CPU) 查找第一个有有效数值的CPU温度传感器"""
+    for sensor_id in SENSOR_CPU_TEMPS:
+        if not math.isnan(record_value(sensors_data.get(sensor_id))):
+            return sensor_id
+    return None
+
+def find_cpu_clock_ids(sensors_data: Dict[str, SensorRecord]) -> list:
+    """查找所有CPU核心时钟传感器ID (SCC-*)"""
+    return [sensor_id for sensor_id, sensor_data in sensors_data.items()
+            if sensor_id.startswith(CPU_CLOCK_PREFIX) and 'Clock' in sensor_data.label]
+
+def read_aida64_shared_memory() -> Dict[str, SensorRecord]:
+    """读取AIDA64共享内存数据"""
+    global _sensor_cache, _cache_valid, _cache_ts, _cpu_clock_ids, _cpu_temp_id
+    
+    # 缓存未过期时直接返回，避免重复读取共享内存和解析XML
+    if _cache_valid and (time.monotonic() - _cache_ts) < _CACHE_TTL:
+        return _sensor_cache
+    
+    with _shm_lock:
+        # 其他线程可能在等待锁期间已刷新缓存，再次检查，保证每个缓存周期只解析一次
+        if _cache_valid and (time.monotonic() - _cache_ts) < _CACHE_TTL:
+            return _sensor_cache
+        
+        try:
+            open_aida64_shared_memory()
             
-            try:
-                # 读取以null结尾的完整字符串
-                raw_bytes = ctypes.string_at(p_buf)
-                xml_str = raw_bytes.decode("utf-8", errors="ignore")
-                
-                # 修复XML格式 (添加根节点)
-                xml_str = f"<AIDA64>{xml_str}</AIDA64>"
-                root = ET.fromstring(xml_str)
-                
-                # 解析传感器数据
-                sensors_data = {}
-                
-                # 解析系统信息
-                for sys_elem in root.findall('sys'):
-                    id_elem = sys_elem.find('id')
-                    label_elem = sys_elem.find('label')
-                    value_elem = sys_elem.find('value')
-                    if id_elem is not None and label_elem is not None and value_elem is not None:
-                        sensors_data[id_elem.text] = {
-                            'type': 'sys',
-                            'label': label_elem.text,
-                            'value': value_elem.text
-                        }
-                
-                # 解析温度信息
-                for temp_elem in root.findall('temp'):
-                    id_elem = temp_elem.find('id')
-                    label_elem = temp_elem.find('label')
-                    value_elem = temp_elem.find('value')
-                    if id_elem is not None and label_elem is not None and value_elem is not None:
-                        sensors_data[id_elem.text] = {
-                            'type': 'temp',
-                            'label': label_elem.text,
-                            'value': value_elem.text
-                        }
-                
-                # 解析风扇信息
-                for fan_elem in root.findall('fan'):
-                    id_elem = fan_elem.find('id')
-                    label_elem = fan_elem.find('label')
-                    value_elem = fan_elem.find('value')
-                    if id_elem is not None and label_elem is not None and value_elem is not None:
-                        sensors_data[id_elem.text] = {
-                            'type': 'fan',
-                            'label': label_elem.text,
-                            'value': value_elem.text
-                        }
-                
-                # 解析电压信息
-                for volt_elem in root.findall('volt'):
-                    id_elem = volt_elem.find('id')
-                    label_elem = volt_elem.find('label')
-                    value_elem = volt_elem.find('value')
-                    if id_elem is not None and label_elem is not None and value_elem is not None:
-                        sensors_data[id_elem.text] = {
-                            'type': 'volt',
-                            'label': label_elem.text,
-                            'value': value_elem.text
-                        }
-                
-                # 解析功耗信息
-                for pwr_elem in root.findall('pwr'):
-                    id_elem = pwr_elem.find('id')
-                    label_elem = pwr_elem.find('label')
-                    value_elem = pwr_elem.find('value')
-                    if id_elem is not None and label_elem is not None and value_elem is not None:
-                        sensors_data[id_elem.text] = {
-                            'type': 'pwr',
-                            'label': label_elem.text,
-                            'value': value_elem.text
-                        }
-                
-                # 更新缓存
-                _sensor_cache = sensors_data
-                _cache_valid = True
-                
-                return sensors_data
-                
-            finally:
-                UnmapViewOfFile(p_buf)
-        finally:
-            CloseHandle(h_map_file)
+            # 按映射大小一次性拷贝，再截断到第一个null，避免string_at逐字节查找结尾
+            raw_bytes = ctypes.string_at(_p_buf, _buf_size)
+            end = raw_bytes.find(b"\x00")
+            if end >= 0:
+                raw_bytes = raw_bytes[:end]
             
-    except Exception as e:
-        logger.error(f"读取AIDA64共享内存失败: {e}")
-        _cache_valid = False
-        return {}
+            sensors_data = parse_aida64(raw_bytes)
+            convert_memory_bytes(sensors_data)
+            
+            # 每个缓存周期查找一次核心时钟传感器，Cpu.frequency无需每次扫描全部传感器
+            _cpu_clock_ids = find_cpu_clock_ids(sensors_data)
+            _cpu_temp_id = find_cpu_temp_id(sensors_data)
+            
+            # 更新缓存
+            _sensor_cache = sensors_data
+            _cache_valid = True
+            _cache_ts = time.monotonic()
+            
+            return sensors_data
+            
+        except Exception as e:
+            logger.error(f"读取AIDA64共享内存失败: {e}")
+            # 关闭共享内存，下次读取时重新打开
+            close_aida64_shared_memory()
+            _cache_valid = False
+            return {}
 
-def get_sensor_value(sensor_id: str, default_value=math.nan) -> float:
-    """获取传感器数值"""
+def cached_psutil_call(func, *args, **kwargs):
+    """调用psutil函数，并在缓存有效期内复用上一次的结果"""
+    key = (func, args, tuple(kwargs.items()))
+    cached = _psutil_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and (now - cached[0]) < _CACHE_TTL:
+        return cached[1]
+    result = func(*args, **kwargs)
+    _psutil_cache[key] = (now, result)
+    return result
+
+def record_value(record: Optional[SensorRecord], default_value=math.nan) -> float:
+    """将传感器记录的数值转换为浮点数，记录不存在或数值无效时返回默认值"""
+    if record is None:
+        return default_value
     try:
-        data = read_aida64_shared_memory()
-        if sensor_id in data:
-            return float(data[sensor_id]['value'])
-    except (ValueError, KeyError, TypeError):
-        pass
-    return default_value
+        return float(record.value)
+    except ValueError:
+        return default_value
+
+def get_sensor_value(sensor_id: str, default_value=math.nan) -> float:
+    """获取传感器数值
+    
+    只有WANTED_SENSOR_IDS中的传感器和CPU核心时钟 (SCC-*) 会被解析，其他ID总是返回默认值
+    """
+    # read_aida64_shared_memory()自身处理读取错误，此处只需查找
+    return record_value(read_aida64_shared_memory().get(sensor_id), default_value)
+
+def get_sensor_values(sensor_ids: Sequence[str], default_value=math.nan) -> Dict[str, float]:
+    """一次读取获取多个传感器数值"""
+    data = read_aida64_shared_memory()
+    return {sensor_id: record_value(data.get(sensor_id), default_value) for sensor_id in sensor_ids}
+
+def get_sensor_bytes(sensor_id: str, default_value: int = 0) -> int:
+    """获取内存传感器换算为字节后的数值 (见MEMORY_MB_SENSORS)"""
+    record = read_aida64_shared_memory().get(sensor_id)
+    if record is None or record.value_bytes is None:
+        return default_value
+    return record.value_bytes
 
 def get_sensor_string(sensor_id: str, default_value: str = "") -> str:
-    """获取传感器字符串值"""
-    try:
-        data = read_aida64_shared_memory()
-        if sensor_id in data:
-            return str(data[sensor_id]['value'])
-    except (KeyError, TypeError):
-        pass
-    return default_value
+    """获取传感器字符串值 (与get_sensor_value相同，只支持解析时保留的传感器)"""
+    record = read_aida64_shared_memory().get(sensor_id)
+    return record.value if record is not None else default_value
 
 class Cpu(sensors.Cpu):
     @staticmethod
     def percentage(interval: float) -> float:
         """CPU使用率"""
-        return get_sensor_value('SCPUUTI')
+        return get_sensor_value(SENSOR_CPU_USAGE)
     
     @staticmethod
     def frequency() -> float:
         """CPU频率 (MHz)"""
         # 尝试获取总体CPU时钟
-        cpu_clock = get_sensor_value('SCPUCLK')
+        cpu_clock = get_sensor_value(SENSOR_CPU_CLOCK)
         if not math.isnan(cpu_clock):
             return cpu_clock
         
-        # 如果没有总体时钟，计算所有核心的平均频率
-        frequencies = []
-        data = read_aida64_shared_memory()
-        for sensor_id, sensor_data in data.items():
-            if sensor_id.startswith('SCC-') and 'Clock' in sensor_data.get('label', ''):
-                try:
-                    freq = float(sensor_data['value'])
-                    frequencies.append(freq)
-                except (ValueError, TypeError):
-                    continue
-        
-        if frequencies:
-            return max(frequencies)  # 返回最高频率
-        
-        return math.nan
+        # 如果没有总体时钟，返回所有核心中的最高频率
+        frequencies = get_sensor_values(_cpu_clock_ids).values()
+        return max((freq for freq in frequencies if not math.isnan(freq)), default=math.nan)
     
     @staticmethod
     def load() -> Tuple[float, float, float]:
         """系统负载 (1/5/15分钟平均值)"""
         # AIDA64不提供系统负载，使用psutil
         try:
-            return psutil.getloadavg()
+            return cached_psutil_call(psutil.getloadavg)
         except AttributeError:
             # Windows上psutil可能没有getloadavg
-            cpu_percent = get_sensor_value('SCPUUTI')
+            cpu_percent = get_sensor_value(SENSOR_CPU_USAGE)
             if not math.isnan(cpu_percent):
                 load_val = cpu_percent / 100.0
                 return (load_val, load_val, load_val)
@@ -237,25 +414,16 @@ class Cpu(sensors.Cpu):
     @staticmethod
     def temperature() -> float:
         """CPU温度 (°C)"""
-        # 优先使用CPU Package温度
-        temp = get_sensor_value('TCPUPKG')
-        if not math.isnan(temp):
-            return temp
-        
-        # 其次使用CPU IA Cores温度
-        temp = get_sensor_value('TCPUIAC')
-        if not math.isnan(temp):
-            return temp
-        
-        # 最后使用普通CPU温度
-        return get_sensor_value('TCPU')
+        # 先刷新缓存，_cpu_temp_id随每次解析更新
+        data = read_aida64_shared_memory()
+        return record_value(data.get(_cpu_temp_id))
     
     @staticmethod
     def fan_percent(fan_name: str = None) -> float:
         """CPU风扇转速百分比"""
         # AIDA64提供的是RPM，需要转换为百分比
         # 这里假设最大转速为2000 RPM
-        fan_rpm = get_sensor_value('FCPU')
+        fan_rpm = get_sensor_value(SENSOR_CPU_FAN)
         if not math.isnan(fan_rpm):
             # 简单的转换，假设最大转速2000 RPM
             return min(100.0, (fan_rpm / 2000.0) * 100.0)
@@ -264,12 +432,12 @@ class Cpu(sensors.Cpu):
     @staticmethod
     def voltage() -> float:
         """CPU电压 (V)"""
-        return get_sensor_value('VCPU')
+        return get_sensor_value(SENSOR_CPU_VOLTAGE)
     
     @staticmethod
     def power() -> float:
         """CPU功耗 (W)"""
-        return get_sensor_value('PCPUPKG')
+        return get_sensor_value(SENSOR_CPU_POWER)
 
 class Gpu(sensors.Gpu):
     @staticmethod
@@ -278,12 +446,11 @@ class Gpu(sensors.Gpu):
         # GPU负载 - AIDA64可能没有直接的GPU负载，返回NaN
         load = math.nan
         
-        # GPU温度
-        temp = get_sensor_value('TGPU1')
-        
-        # 显存信息
-        used_mem = get_sensor_value('SUSEDVMEM')  # MB
-        free_mem = get_sensor_value('SFREEVMEM')  # MB
+        # GPU温度和显存信息 (MB)
+        values = get_sensor_values((SENSOR_GPU_TEMP, SENSOR_GPU_USED_MEM, SENSOR_GPU_FREE_MEM))
+        temp = values[SENSOR_GPU_TEMP]
+        used_mem = values[SENSOR_GPU_USED_MEM]
+        free_mem = values[SENSOR_GPU_FREE_MEM]
         
         if not math.isnan(used_mem) and not math.isnan(free_mem):
             total_mem = used_mem + free_mem
@@ -300,7 +467,7 @@ class Gpu(sensors.Gpu):
     @staticmethod
     def fan_percent() -> float:
         """GPU风扇转速百分比"""
-        fan_rpm = get_sensor_value('FGPU1')
+        fan_rpm = get_sensor_value(SENSOR_GPU_FAN)
         if not math.isnan(fan_rpm):
             # 简单的转换，假设最大转速3000 RPM
             return min(100.0, (fan_rpm / 3000.0) * 100.0)
@@ -314,17 +481,17 @@ class Gpu(sensors.Gpu):
     @staticmethod
     def voltage() -> float:
         """GPU电压 (V)"""
-        return get_sensor_value('VGPU1')
+        return get_sensor_value(SENSOR_GPU_VOLTAGE)
     
     @staticmethod
     def power() -> float:
         """GPU功耗 (W)"""
-        return get_sensor_value('PGPU1')
+        return get_sensor_value(SENSOR_GPU_POWER)
     
     @staticmethod
     def is_available() -> bool:
         """检查GPU是否可用"""
-        temp = get_sensor_value('TGPU1')
+        temp = get_sensor_value(SENSOR_GPU_TEMP)
         return not math.isnan(temp)
 
 class Memory(sensors.Memory):
@@ -332,35 +499,29 @@ class Memory(sensors.Memory):
     def swap_percent() -> float:
         """交换文件使用百分比"""
         # 使用虚拟内存使用率作为交换文件使用率
-        return get_sensor_value('SVIRTMEMUTI')
+        return get_sensor_value(SENSOR_SWAP_USAGE)
     
     @staticmethod
     def virtual_percent() -> float:
         """虚拟内存使用百分比"""
-        return get_sensor_value('SMEMUTI')
+        return get_sensor_value(SENSOR_MEMORY_USAGE)
     
     @staticmethod
     def virtual_used() -> int:
         """已用内存 (字节)"""
-        used_mb = get_sensor_value('SUSEDMEM')
-        if not math.isnan(used_mb):
-            return int(used_mb * 1024 * 1024)  # 转换为字节
-        return 0
+        return get_sensor_bytes(SENSOR_MEMORY_USED)
     
     @staticmethod
     def virtual_free() -> int:
         """可用内存 (字节)"""
-        free_mb = get_sensor_value('SFREEMEM')
-        if not math.isnan(free_mb):
-            return int(free_mb * 1024 * 1024)  # 转换为字节
-        return 0
+        return get_sensor_bytes(SENSOR_MEMORY_FREE)
 
 class Disk(sensors.Disk):
     @staticmethod
     def disk_usage_percent() -> float:
         """磁盘使用百分比 - AIDA64不直接提供，使用psutil"""
         try:
-            return psutil.disk_usage('/').percent
+            return cached_psutil_call(psutil.disk_usage, '/').percent
         except:
             return math.nan
     
@@ -368,7 +529,7 @@ class Disk(sensors.Disk):
     def disk_used() -> int:
         """已用磁盘空间 (字节)"""
         try:
-            return psutil.disk_usage('/').used
+            return cached_psutil_call(psutil.disk_usage, '/').used
         except:
             return 0
     
@@ -376,7 +537,7 @@ class Disk(sensors.Disk):
     def disk_free() -> int:
         """可用磁盘空间 (字节)"""
         try:
-            return psutil.disk_usage('/').free
+            return cached_psutil_call(psutil.disk_usage, '/').free
         except:
             return 0
 
@@ -386,7 +547,7 @@ class Net(sensors.Net):
         """网络统计信息 - AIDA64不提供网络统计，使用psutil"""
         try:
             # 获取网络接口统计信息
-            net_io = psutil.net_io_counters(pernic=True)
+            net_io = cached_psutil_call(psutil.net_io_counters, pernic=True)
             if if_name in net_io:
                 stats = net_io[if_name]
                 # 简单返回累计值，速率计算需要在调用方实现
@@ -395,15 +556,15 @@ class Net(sensors.Net):
         except:
             return 0, 0, 0, 0
 
-# 初始化日志
-logger.info("AIDA64传感器模块已加载")
-
-# 测试连接
-try:
-    test_data = read_aida64_shared_memory()
-    if test_data:
-        logger.info(f"成功连接到AIDA64共享内存，找到 {len(test_data)} 个传感器")
-    else:
-        logger.warning("无法从AIDA64共享内存读取数据")
-except Exception as e:
-    logger.error(f"AIDA64传感器初始化失败: {e}")
\ No newline at end of file
+def init():
+    """测试与AIDA64共享内存的连接 (由主程序在选用AIDA64传感器时调用)"""
+    logger.info("AIDA64传感器模块已加载")
+    
+    try:
+        test_data = read_aida64_shared_memory()
+        if test_data:
+            logger.info(f"成功连接到AIDA64共享内存，读取到 {len(test_data)} 个本模块使用的传感器")
+        else:
+            logger.warning("无法从AIDA64共享内存读取数据")
+    except Exception as e:
+        logger.error(f"AIDA64传感器初始化失败: {e}")
@@ -63,6 +63,7 @@ elif HW_SENSORS == "LHM":
 elif HW_SENSORS == "AIDA64":
     if platform.system() == 'Windows':
         import library.sensors.sensors_aida64 as sensors
+        sensors.init()
     else:
         logger.error("AIDA64 integration is only available on Windows")
         try:
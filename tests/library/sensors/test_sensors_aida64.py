@@ -0,0 +1,51 @@
+import ctypes
+import unittest
+from unittest import mock
+
+# sensors_aida64 loads kernel32 through ctypes.windll at import time: stub it so the parser can be tested anywhere
+with mock.patch.object(ctypes, "windll", mock.MagicMock(), create=True):
+    from library.sensors.sensors_aida64 import parse_aida64, convert_memory_bytes, SensorRecord
+
+
+class TestParseAida64(unittest.TestCase):
+    def test_parse_records(self):
+        data = parse_aida64(b"<sys><id>SCPUCLK</id><label>CPU Clock</label><value>2394</value></sys>"
+                            b"<temp><id>TCPU</id><label>CPU</label><value>45</value></temp>")
+        self.assertEqual(data, {
+            'SCPUCLK': SensorRecord('sys', 'CPU Clock', '2394'),
+            'TCPU': SensorRecord('temp', 'CPU', '45'),
+        })
+
+    def test_entities(self):
+        data = parse_aida64(b"<temp><id>TCPU</id><label>CPU &amp; &quot;x&quot; &apos;y&apos; &lt;&gt; &#176;</label>"
+                            b"<value>45</value></temp>")
+        self.assertEqual(data['TCPU'].label, 'CPU & "x" \'y\' <> °')
+
+    def test_missing_field(self):
+        data = parse_aida64(b"<temp><id>TCPU</id><label>CPU</label></temp>"
+                            b"<fan><id>FCPU</id><label>CPU</label><value>1200</value></fan>")
+        self.assertEqual(list(data), ['FCPU'])
+
+    def test_truncated_trailing_record(self):
+        data = parse_aida64(b"<fan><id>FCPU</id><label>CPU</label><value>1200</value></fan>"
+                            b"<temp><id>TCPU</id><label>CPU</label><val")
+        self.assertEqual(list(data), ['FCPU'])
+
+    def test_non_sensor_tags(self):
+        data = parse_aida64(b"<?xml version=\"1.0\"?><AIDA64><other><id>TCPU</id><label>x</label><value>1</value></other>"
+                            b"<volt><id>VCPU</id><label>CPU Core</label><value>1.2</value></volt></AIDA64>")
+        self.assertEqual(data, {'VCPU': SensorRecord('volt', 'CPU Core', '1.2')})
+
+    def test_nul_padded_tail(self):
+        data = parse_aida64(b"<pwr><id>PCPUPKG</id><label>CPU Package</label><value>35</value></pwr>" + b"\x00" * 64)
+        self.assertEqual(data, {'PCPUPKG': SensorRecord('pwr', 'CPU Package', '35')})
+
+    def test_unused_sensor_ids(self):
+        data = parse_aida64(b"<sys><id>SFOO</id><label>Unused</label><value>1</value></sys>"
+                            b"<sys><id>SCC-1-1</id><label>CPU Core #1 Clock</label><value>5287</value></sys>")
+        self.assertEqual(data, {'SCC-1-1': SensorRecord('sys', 'CPU Core #1 Clock', '5287')})
+
+    def test_convert_memory_bytes(self):
+        data = parse_aida64(b"<sys><id>SUSEDMEM</id><label>Used Memory</label><value>1024</value></sys>")
+        convert_memory_bytes(data)
+        self.assertEqual(data['SUSEDMEM'].value_bytes, 1073741824)